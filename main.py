@@ -3,25 +3,89 @@ from pathlib import Path
 from typing import List, Optional
 import sys
 import cmd
-import shlex
 from src.editor.session import Session
-from src.utils.directory_viewer import DirectoryViewer
 from src.commands.edit_commands import (InsertCommand, AppendCommand, DeleteCommand, EditIdCommand, EditTextCommand)
 from src.commands.display_commands import (PrintTreeCommand, PrintIndentCommand, SpellCheckCommand)
 from src.exceptions.editor_exceptions import EditorException
 
+def _quick_split(arg: str, maxsplit: int = -1) -> List[str]:
+    """
+    按空白快速分词，仅在出现引号时才退回到shlex的完整词法分析
+
+    Args:
+        arg: 命令参数字符串
+        maxsplit: 最大分割次数，超出部分作为整体保留（-1表示不限制）
+
+    Returns:
+        分词后的参数列表
+    """
+    if '"' not in arg and "'" not in arg:
+        return arg.split(None, maxsplit)
+    import shlex  # 延迟导入：仅在出现引号时才需要完整词法分析
+    parts = shlex.split(arg)
+    if 0 <= maxsplit < len(parts) - 1:
+        parts[maxsplit:] = [" ".join(parts[maxsplit:])]
+    return parts
+
 class HTMLEditorShell(cmd.Cmd):
     """HTML编辑器的命令行界面"""
     
     intro = '欢迎使用HTML编辑器。输入 help 或 ? 查看帮助。\n'
     prompt = 'html-editor> '
-    
+    # 允许命令名中出现连字符，使"edit-text"等命令可被内置分发器直接解析
+    identchars = cmd.Cmd.identchars + '-'
+
     def __init__(self):
         """初始化编辑器shell"""
         super().__init__()
         self.session = Session()
         self.base_dir = Path.cwd()
-    
+        # resolve()会触发系统调用，基础目录在shell生命周期内不变，只解析一次
+        self._base_dir_resolved = self.base_dir.resolve()
+        # 缓存每个文件相对基础目录的显示路径，避免每次dir命令重复resolve
+        self._rel_path_cache = {}
+        # 预构建命令分发表：命令名 -> 已绑定的处理方法
+        self._dispatch = {name[3:]: getattr(self, name)
+                          for name in dir(self) if name.startswith('do_')}
+
+    def onecmd(self, line: str):
+        """优先查预构建的分发表，跳过基类逐条命令的getattr解析"""
+        stripped = line.strip()
+        cmd_name, _, arg = stripped.partition(' ')
+        handler = self._dispatch.get(cmd_name)
+        if handler is None:
+            # 空行、help简写（?）等特殊输入仍交给基类处理
+            return super().onecmd(line)
+        self.lastcmd = stripped
+        return handler(arg.strip())
+
+    def _collect_open_files(self):
+        """
+        收集当前打开文件的显示路径及活动文件
+
+        Returns:
+            (打开文件路径集合, 活动文件路径或None)
+        """
+        open_files = set()
+        active_file = None
+
+        for editor in self.session.editors.values():
+            file_str = self._rel_path_cache.get(editor.filepath)
+            if file_str is None:
+                try:
+                    rel_path = editor.filepath.resolve().relative_to(self._base_dir_resolved)
+                    file_str = str(rel_path)
+                except ValueError:
+                    # 如果文件不在基础目录下，使用完整路径
+                    file_str = str(editor.filepath)
+                self._rel_path_cache[editor.filepath] = file_str
+
+            open_files.add(file_str)
+            if editor == self.session.active_editor:
+                active_file = file_str
+
+        return open_files, active_file
+
     aliases = {
         "edit-text": "edit_text",   
         "print-indent": "print_indent",
@@ -33,17 +97,6 @@ class HTMLEditorShell(cmd.Cmd):
         "dir-indent": "dir_indent"
     }
 
-    def onecmd(self, line):
-        """将命令中的 "-" 替换为 "_" """
-        cmd = line.split(' ')[0] if ' ' in line else line
-        if cmd in self.aliases:
-            cmd = self.aliases[cmd]
-            if ' ' in line:
-                line = f"{cmd} {line.split(' ', 1)[1]}"
-            else:
-                line = cmd
-        return super().onecmd(line)
-    
     def preloop(self):
         """命令行启动前的准备工作"""
         if not self.session.active_editor:
@@ -144,14 +197,14 @@ class HTMLEditorShell(cmd.Cmd):
         在指定位置前插入新元素
         用法: insert tagName idValue insertLocation [textContent]
         """
-        args = shlex.split(arg)
+        args = _quick_split(arg, maxsplit=3)
         if len(args) < 3:
             print("错误：参数不足")
             return
-        
-        tag_name, id_value, insert_location, *text = args
-        text_content = " ".join(text) if text else ""
-        
+
+        tag_name, id_value, insert_location = args[:3]
+        text_content = args[3] if len(args) > 3 else ""
+
         command = InsertCommand(
             self.session.active_editor.document,
             tag_name, id_value, insert_location, text_content
@@ -166,14 +219,14 @@ class HTMLEditorShell(cmd.Cmd):
         在指定元素内添加子元素
         用法: append tagName idValue parentElement [textContent]
         """
-        args = shlex.split(arg)
+        args = _quick_split(arg, maxsplit=3)
         if len(args) < 3:
             print("错误：参数不足")
             return
-        
-        tag_name, id_value, parent_id, *text = args
-        text_content = " ".join(text) if text else ""
-        
+
+        tag_name, id_value, parent_id = args[:3]
+        text_content = args[3] if len(args) > 3 else ""
+
         command = AppendCommand(
             self.session.active_editor.document,
             tag_name, id_value, parent_id, text_content
@@ -220,14 +273,14 @@ class HTMLEditorShell(cmd.Cmd):
         修改元素文本
         用法: edit-text elementId [newText]
         """
-        args = shlex.split(arg)
+        args = _quick_split(arg, maxsplit=1)
         if not args:
             print("错误：请指定元素ID")
             return
-        
-        element_id, *text = args
-        text_content = " ".join(text) if text else ""
-        
+
+        element_id = args[0]
+        text_content = args[1] if len(args) > 1 else ""
+
         command = EditTextCommand(
             self.session.active_editor.document,
             element_id, text_content
@@ -305,24 +358,9 @@ class HTMLEditorShell(cmd.Cmd):
         以树形结构显示目录
         用法: dir-tree
         """
+        from src.utils.directory_viewer import DirectoryViewer
         try:
-            open_files = set()
-            active_file = None
-            
-            for editor in self.session.editors.values():
-                try:
-                    rel_path = editor.filepath.resolve().relative_to(self.base_dir.resolve())
-                    file_str = str(rel_path)
-                    open_files.add(file_str)
-                    if editor == self.session.active_editor:
-                        active_file = file_str
-                except ValueError:
-                    # 如果文件不在基础目录下，使用完整路径
-                    file_str = str(editor.filepath)
-                    open_files.add(file_str)
-                    if editor == self.session.active_editor:
-                        active_file = file_str
-            
+            open_files, active_file = self._collect_open_files()
             print(DirectoryViewer.get_tree_view(
                 self.base_dir, open_files, active_file))
         except Exception as e:
@@ -333,24 +371,9 @@ class HTMLEditorShell(cmd.Cmd):
         以缩进结构显示目录
         用法: dir-indent
         """
+        from src.utils.directory_viewer import DirectoryViewer
         try:
-            open_files = set()
-            active_file = None
-            
-            for editor in self.session.editors.values():
-                try:
-                    rel_path = editor.filepath.resolve().relative_to(self.base_dir.resolve())
-                    file_str = str(rel_path)
-                    open_files.add(file_str)
-                    if editor == self.session.active_editor:
-                        active_file = file_str
-                except ValueError:
-                    # 如果文件不在基础目录下，使用完整路径
-                    file_str = str(editor.filepath)
-                    open_files.add(file_str)
-                    if editor == self.session.active_editor:
-                        active_file = file_str
-            
+            open_files, active_file = self._collect_open_files()
             print(DirectoryViewer.get_indented_view(
                 self.base_dir, open_files, active_file))
         except Exception as e:
@@ -375,9 +398,8 @@ class HTMLEditorShell(cmd.Cmd):
         用法: quit
         """
         # 检查是否有未保存的文件
-        modified_files = [filename for filename, editor in self.session.editors.items()
-                         if editor.is_modified]
-        
+        modified_files = self.session.get_modified_files()
+
         if modified_files:
             print("以下文件尚未保存：")
             for filename in modified_files:
@@ -396,6 +418,11 @@ class HTMLEditorShell(cmd.Cmd):
         print(f"错误：未知命令 '{line}'")
         print("使用 'help' 查看可用命令")
 
+# 预编译别名：把带连字符的命令名直接注册为do_方法，
+# 之后cmd.Cmd的内置getattr分发即可命中，无需每条命令做字符串重写
+for _alias, _target in HTMLEditorShell.aliases.items():
+    setattr(HTMLEditorShell, f'do_{_alias}', getattr(HTMLEditorShell, f'do_{_target}'))
+
 def main():
     """主程序入口"""
     try:
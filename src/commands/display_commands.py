@@ -2,7 +2,17 @@ from typing import Optional
 from .command import Command
 from ..models.html_document import HTMLDocument
 from ..utils.html_parser import HTMLParser
-from ..utils.spell_checker import SpellChecker
+
+# 模块级单例：拼写词典加载开销大，所有显示命令共享同一个检查器实例
+_SPELL_CHECKER = None
+
+def _get_spell_checker():
+    """延迟构造并返回共享的SpellChecker实例"""
+    global _SPELL_CHECKER
+    if _SPELL_CHECKER is None:
+        from ..utils.spell_checker import SpellChecker
+        _SPELL_CHECKER = SpellChecker()
+    return _SPELL_CHECKER
 
 class DisplayCommand(Command):
     """显示相关的命令基类，提供显示HTML文档内容的基本功能"""
@@ -18,12 +28,10 @@ class DisplayCommand(Command):
             所有显示命令都不支持撤销操作
         """
         self.document = document
-    
-    @property
-    def can_undo(self) -> bool:
-        """显示命令不支持撤销"""
-        return False
-    
+
+    # 显示命令不支持撤销：用类属性代替property，省去每次检查的描述符调用
+    can_undo = False
+
     def undo(self) -> bool:
         """显示命令不支持撤销"""
         return False
@@ -44,7 +52,7 @@ class PrintTreeCommand(DisplayCommand):
         """
         super().__init__(document)
         self.show_id = show_id
-        self.spell_checker = SpellChecker()
+        self.spell_checker = _get_spell_checker()
     
     def execute(self) -> bool:
         if not self.document:
@@ -100,7 +108,7 @@ class SpellCheckCommand(DisplayCommand):
             - 显示命令不会修改文档内容
         """
         super().__init__(document)
-        self.spell_checker = SpellChecker()
+        self.spell_checker = _get_spell_checker()
     
     def execute(self) -> bool:
         if not self.document:
@@ -111,22 +119,24 @@ class SpellCheckCommand(DisplayCommand):
             print("未发现拼写错误。")
             return True
         
-        print("发现以下拼写错误：")
+        # 先拼好完整报告再一次性输出，避免逐行print的重复系统调用
+        lines = ["发现以下拼写错误："]
         for node_id, node_errors in errors.items():
             if not node_errors:
                 continue
-            
-            print(f"\n节点 {node_id}:")
+
+            lines.append(f"\n节点 {node_id}:")
             for error in node_errors:
-                print(f"  句子：{error['text']}")
-                print("  拼写可能有误的单词：")
+                lines.append(f"  句子：{error['text']}")
+                lines.append("  拼写可能有误的单词：")
                 for word in error['misspelled']:
                     if word in error['suggestions']:
                         suggestions = error['suggestions'][word]
                         if isinstance(suggestions, (list, tuple, set)):
                             suggestions_str = ', '.join(suggestions)
-                            print(f"    - {word}: {suggestions_str}")
+                            lines.append(f"    - {word}: {suggestions_str}")
                         else:
-                            print(f"    - {word}: {suggestions}")
-        
+                            lines.append(f"    - {word}: {suggestions}")
+
+        print("\n".join(lines))
         return True 
\ No newline at end of file
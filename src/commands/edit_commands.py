@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from .command import Command
 from ..models.html_document import HTMLDocument
 from ..models.html_node import HTMLNode
@@ -159,7 +159,8 @@ class DeleteCommand(EditCommand):
             
         Note:
             - 删除节点时会同时删除其所有子节点
-            - 删除操作可以撤销，会保存节点的完整状态
+            - 删除操作可以撤销：只保存被删子树的引用和原位置
+              （父节点ID、后继兄弟ID），不做整树快照或深拷贝
             - 如果节点不存在，删除将失败
         """
         super().__init__(document)
@@ -273,21 +274,54 @@ class EditTextCommand(EditCommand):
             
         Note:
             - 只能修改节点的直接文本内容
-            - 会保存原文本内容用于撤销
+            - 会以差量形式保存原文本用于撤销，避免长文本的完整拷贝
             - 如果节点不存在，修改将失败
         """
         super().__init__(document)
         self.node_id = node_id
         self.new_text = new_text
-        self.old_text: Optional[str] = None
+        # 撤销备忘录：(公共前缀长度, 公共后缀长度, 被替换的原文本片段)
+        self._undo_diff: Optional[Tuple[int, int, str]] = None
+        self._no_op = False  # 新文本与原文本相同时无需真正执行
         self._save_old_text()
-        
+
     def _save_old_text(self) -> None:
-        """保存原文本内容用于撤销"""
+        """以差量备忘录形式保存原文本内容用于撤销"""
         node = self.document.get_node_by_id(self.node_id)
         if node:
-            self.old_text = node.text
-            
+            if node.text == self.new_text:
+                self._no_op = True
+            else:
+                self._undo_diff = self._make_diff(node.text, self.new_text)
+
+    @staticmethod
+    def _make_diff(old_text: str, new_text: str) -> Tuple[int, int, str]:
+        """
+        计算新旧文本的公共前缀/后缀，只保留真正被替换的中间片段
+
+        Args:
+            old_text: 修改前的文本
+            new_text: 修改后的文本
+
+        Returns:
+            (前缀长度, 后缀长度, 原文本中间片段)
+        """
+        prefix = 0
+        max_common = min(len(old_text), len(new_text))
+        while prefix < max_common and old_text[prefix] == new_text[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < max_common - prefix and
+               old_text[len(old_text) - 1 - suffix] == new_text[len(new_text) - 1 - suffix]):
+            suffix += 1
+        return prefix, suffix, old_text[prefix:len(old_text) - suffix]
+
+    def _restore_old_text(self) -> str:
+        """根据差量备忘录和新文本还原出原文本"""
+        prefix, suffix, old_middle = self._undo_diff
+        tail = self.new_text[len(self.new_text) - suffix:] if suffix else ""
+        return self.new_text[:prefix] + old_middle + tail
+
     def execute(self) -> bool:
         try:
             # 先检查节点是否存在
@@ -295,7 +329,11 @@ class EditTextCommand(EditCommand):
             if not node:
                 print(f"错误：未找到节点 '{self.node_id}'")
                 return False
-                
+
+            # 文本没有变化时直接视为成功，不触碰文档的修改状态
+            if self._no_op:
+                return True
+
             self.document.edit_node_text(self.node_id, self.new_text)
             return True
         except InvalidNodeError as e:
@@ -303,14 +341,14 @@ class EditTextCommand(EditCommand):
             return False
             
     def undo(self) -> bool:
-        if self.old_text is not None:
+        if self._undo_diff is not None:
             try:
-                self.document.edit_node_text(self.node_id, self.old_text)
+                self.document.edit_node_text(self.node_id, self._restore_old_text())
                 return True
             except InvalidNodeError:
                 return False
         return False
-        
+
     @property
     def can_undo(self) -> bool:
-        return self.old_text is not None 
\ No newline at end of file
+        return self._undo_diff is not None
\ No newline at end of file
@@ -16,28 +16,21 @@ class IOCommand(Command):
             document: 要操作的HTML文档对象
             
         Note:
-            IO命令的撤销行为由具体子类实现
+            IO命令均不支持撤销
         """
         self.document = document
-    
-    @property
-    def can_undo(self) -> bool:
-        """
-        检查命令是否可以撤销
-        
-        Returns:
-            bool: 可以撤销返回True，否则返回False
-        """
-        raise NotImplementedError
-    
+
+    # IO命令不支持撤销：用类属性代替property，省去每次检查的描述符调用
+    can_undo = False
+
     def undo(self) -> bool:
         """
         撤销命令
-        
+
         Returns:
-            bool: 撤销成功返回True，失败返回False
+            bool: IO命令不支持撤销，始终返回False
         """
-        raise NotImplementedError
+        return False
 
 class ReadCommand(IOCommand):
     """从文件读取HTML内容的命令"""
@@ -61,22 +54,25 @@ class ReadCommand(IOCommand):
     
     def execute(self) -> bool:
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+            # 一次性读入原始字节再整体解码：整文件读取无需经过
+            # TextIOWrapper的增量解码器，少一层缓冲对象。
+            # 先尝试ASCII解码：纯ASCII文件（英文HTML的常态）走
+            # 无状态机的紧凑C循环，失败时再按UTF-8完整解码
+            raw = Path(self.filepath).read_bytes()
+            try:
+                content = raw.decode('ascii')
+            except UnicodeDecodeError:
+                content = raw.decode('utf-8')
+
             new_document = HTMLParser.parse_html(content)
-            # 更新当前文档的内容
-            self.document.root = new_document.root
+            # 更新当前文档的内容，并通过set_root同步重建ID索引，
+            # 保证get_node_by_id的O(1)查找不会使用过期映射
+            self.document.set_root(new_document.root)
             return True
             
         except (FileOperationError, IOError) as e:
             print(f"读取文件失败: {str(e)}")
             return False
-    
-    @property
-    def can_undo(self) -> bool:
-        """读取命令不支持撤销"""
-        return False
 
 class SaveCommand(IOCommand):
     """保存HTML内容到文件的命令"""
@@ -99,21 +95,17 @@ class SaveCommand(IOCommand):
     
     def execute(self) -> bool:
         try:
-            content = HTMLParser.to_html_string(self.document)
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
+            # 逐行流式写出，避免在内存中构造整个文档的字符串
+            # 128KiB缓冲区：批量落盘减少系统调用次数
+            with open(self.filepath, 'w', encoding='utf-8', buffering=131072) as f:
+                f.writelines(HTMLParser.iter_html_lines(self.document))
+
             self.document.set_unmodified()
             return True
             
         except IOError as e:
             print(f"保存文件失败: {str(e)}")
             return False
-    
-    @property
-    def can_undo(self) -> bool:
-        """保存命令不支持撤销"""
-        return False
 
 class InitCommand(IOCommand):
     """初始化空HTML文档的命令"""
@@ -131,12 +123,7 @@ class InitCommand(IOCommand):
             - 初始化操作不支持撤销
         """
         super().__init__(document)
-    
-    @property
-    def can_undo(self) -> bool:
-        """初始化命令不支持撤销"""
-        return False
-    
+
     def execute(self) -> bool:
         try:
             self.document.create_empty_document()
@@ -1,34 +1,64 @@
-from typing import List, Optional, Dict
+from typing import Deque, Dict, Optional
+from collections import deque
 from pathlib import Path
 from ..models.html_document import HTMLDocument
 from ..utils.html_parser import HTMLParser
 from ..commands.command import Command
+from ..commands.display_commands import DisplayCommand
 from ..exceptions.editor_exceptions import EditorException, FileOperationError
 
 class Editor:
     """HTML编辑器核心类，管理单个HTML文档的编辑状态"""
-    
-    def __init__(self, filepath: Optional[Path] = None):
+
+    # 撤销/重做历史的最大长度，防止长会话内存无限增长。
+    # 双栈使用deque：两端操作O(1)、clear()快于list且无过量预分配
+    MAX_HISTORY = 100
+
+    def __init__(self, filepath: Optional[Path] = None, defer_load: bool = False):
         """
         初始化编辑器实例
-        
+
         Args:
             filepath: HTML文件路径，如果提供则加载该文件，否则创建空文档
+            defer_load: 为True时推迟文件解析，首次访问document时才加载
         """
         self.filepath: Optional[Path] = filepath
-        self.document: Optional[HTMLDocument] = None
+        self._document: Optional[HTMLDocument] = None
         self.show_id: bool = True  # 控制树形显示时是否显示ID
         self._modified: bool = False
-        
-        # 撤销/重做相关属性
-        self._undo_stack: List[Command] = []
-        self._redo_stack: List[Command] = []
-        
+
+        # 撤销/重做相关属性：有界双栈，超出上限时自动丢弃最旧的命令
+        self._undo_stack: Deque[Command] = deque(maxlen=self.MAX_HISTORY)
+        self._redo_stack: Deque[Command] = deque(maxlen=self.MAX_HISTORY)
+        # 一旦有命令被淘汰，撤销到栈空也回不到加载时的状态，
+        # 不能再据此清除修改标志
+        self._history_truncated: bool = False
+
+        # 视图缓存：文档未变化时重复显示直接复用上次构建的字符串
+        self._view_cache: Dict[tuple, str] = {}
+
         if filepath and filepath.exists():
-            self.load_file(filepath)
+            if not defer_load:
+                self.load_file(filepath)
+            # defer_load时不在这里解析，见document属性
         else:
             self.init_empty_document()
-        
+
+    @property
+    def document(self) -> Optional[HTMLDocument]:
+        """
+        当前文档对象
+
+        延迟加载的编辑器在首次访问时才真正解析文件
+        """
+        if self._document is None and self.filepath is not None:
+            self.load_file(self.filepath)
+        return self._document
+
+    @document.setter
+    def document(self, value: Optional[HTMLDocument]) -> None:
+        self._document = value
+
     def init_empty_document(self) -> None:
         """
         初始化一个空的HTML文档
@@ -54,10 +84,8 @@ class Editor:
             加载失败时会自动创建空文档
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            self.document = HTMLParser.parse_html(html_content)
+            # 文件句柄直接交给解析器，避免在这里多持有一份全文字符串
+            self.document = HTMLParser.parse_file(filepath)
             self.filepath = filepath
             self._clear_command_stacks()
             self._modified = False
@@ -68,6 +96,25 @@ class Editor:
             self.init_empty_document()
             return False
             
+    def load_document(self, document: HTMLDocument,
+                      filepath: Optional[Path] = None) -> None:
+        """
+        直接装入已构建好的文档对象
+
+        Args:
+            document: 已解析的HTMLDocument对象
+            filepath: 关联的文件路径，可选
+
+        Note:
+            跳过磁盘读取和解析，用于调用方已持有文档的场景；
+            与load_file一样会重置撤销/重做栈和修改标志
+        """
+        self.document = document
+        if filepath is not None:
+            self.filepath = filepath
+        self._clear_command_stacks()
+        self._modified = False
+
     def save_file(self, filepath: Path) -> bool:
         """
         将当前文档保存到文件
@@ -77,15 +124,23 @@ class Editor:
             
         Returns:
             bool: 保存成功返回True，失败返回False
+
+        Note:
+            文档未修改且目标路径未变时直接返回，不重复写盘
         """
         try:
             if self.document is None:
                 return False
-            
-            html_content = HTMLParser.to_html_string(self.document)  # 使用HTMLParser
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
+
+            # 无修改的原地保存是常见的习惯性操作，跳过序列化和磁盘写
+            if not self._modified and filepath == self.filepath and filepath.exists():
+                return True
+
+            # 使用HTMLParser逐行流式写出，避免完整字符串的内存峰值
+            # 128KiB缓冲区：批量落盘减少系统调用次数
+            with open(filepath, 'w', encoding='utf-8', buffering=131072) as f:
+                f.writelines(HTMLParser.iter_html_lines(self.document))
+
             self.filepath = filepath
             self._modified = False
             return True
@@ -105,13 +160,25 @@ class Editor:
             bool: 命令执行成功返回True，失败返回False
             
         Note:
-            成功执行的命令会被添加到撤销栈中
+            成功执行的可撤销命令会被添加到撤销栈中
         """
         try:
             if command.execute():
-                self._undo_stack.append(command)
-                self._redo_stack.clear()  # 清空重做栈
-                self._modified = True  # 设置修改标志
+                # 只记录真正可撤销的命令，避免无操作命令污染撤销栈
+                if command.can_undo:
+                    if len(self._undo_stack) == self.MAX_HISTORY:
+                        self._history_truncated = True  # 即将淘汰最旧的命令
+                    self._undo_stack.append(command)
+                    self._redo_stack.clear()  # 清空重做栈
+                    self._modified = True  # 设置修改标志
+                    self._view_cache.clear()  # 文档已变化，缓存视图失效
+                elif not isinstance(command, DisplayCommand):
+                    # IO类命令不可撤销但同样会改动文档内容：
+                    # 缓存视图一并失效，修改标志与文档自身的状态同步
+                    # （读取按约定重置为未修改）
+                    self._view_cache.clear()
+                    if self.document is not None:
+                        self._modified = self.document.is_modified
                 return True
             return False
         except Exception as e:
@@ -134,7 +201,9 @@ class Editor:
         command = self._undo_stack.pop()
         if command.undo():
             self._redo_stack.append(command)
-            self._modified = len(self._undo_stack) > 0  # 根据撤销栈状态设置修改标志
+            # 根据撤销栈状态设置修改标志；历史被截断后栈空不等于未修改
+            self._modified = len(self._undo_stack) > 0 or self._history_truncated
+            self._view_cache.clear()
             return True
         
         self._undo_stack.append(command)  # 撤销失败，恢复命令
@@ -157,6 +226,7 @@ class Editor:
         if command.execute():
             self._undo_stack.append(command)
             self._modified = True  # 重做成功后设置修改标志
+            self._view_cache.clear()
             return True
         
         self._redo_stack.append(command)  # 重做失败，恢复命令
@@ -170,6 +240,8 @@ class Editor:
         """
         self._undo_stack.clear()
         self._redo_stack.clear()
+        self._history_truncated = False
+        self._view_cache.clear()
         
     def get_tree_view(self) -> str:
         """
@@ -179,11 +251,17 @@ class Editor:
             str: 树形格式的文档结构字符串，如果文档为空返回空字符串
             
         Note:
-            树形视图会根据show_id属性决定是否显示节点ID
+            - 树形视图会根据show_id属性决定是否显示节点ID
+            - 结果按(视图类型, show_id)缓存，文档变化时缓存失效
         """
         if not self.document:
             return ""
-        return HTMLParser.to_tree_string(self.document, self.show_id)
+        key = ('tree', self.show_id)
+        cached = self._view_cache.get(key)
+        if cached is None:
+            cached = HTMLParser.to_tree_string(self.document, self.show_id)
+            self._view_cache[key] = cached
+        return cached
         
     def get_indented_view(self, indent: int = 2) -> str:
         """
@@ -194,10 +272,18 @@ class Editor:
             
         Returns:
             str: 缩进格式的HTML字符串，如果文档为空返回空字符串
+
+        Note:
+            结果按(视图类型, indent)缓存，文档变化时缓存失效
         """
         if not self.document:
             return ""
-        return HTMLParser.to_html_string(self.document, indent)
+        key = ('indent', indent)
+        cached = self._view_cache.get(key)
+        if cached is None:
+            cached = HTMLParser.to_html_string(self.document, indent)
+            self._view_cache[key] = cached
+        return cached
         
     @property
     def is_modified(self) -> bool:
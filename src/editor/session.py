@@ -1,6 +1,7 @@
 from typing import Dict, Optional, List
 from pathlib import Path
 import json
+import os
 from .editor import Editor
 from ..exceptions.editor_exceptions import EditorException
 from ..utils.html_parser import HTMLParser
@@ -40,8 +41,8 @@ class Session:
                 self.active_editor = self.editors[filename]
                 return True
             
+            # Editor构造函数在路径存在时已经完成加载，这里不再重复解析
             editor = Editor(filepath)
-            editor.load_file(filepath)
             self.editors[filename] = editor
             self.active_editor = editor
             return True
@@ -74,9 +75,9 @@ class Session:
             editor = Editor(filepath)
             editor.init_empty_document()
             
-            # 保存空文档到文件系统
-            content = HTMLParser.to_html_string(editor.document)
-            filepath.write_text(content, encoding='utf-8')
+            # 保存空文档到文件系统（128KiB缓冲区，批量落盘）
+            with open(filepath, 'w', encoding='utf-8', buffering=131072) as f:
+                f.writelines(HTMLParser.iter_html_lines(editor.document))
             
             # 将编辑器添加到会话中
             self.editors[filename] = editor
@@ -133,6 +134,20 @@ class Session:
         self.active_editor = self.editors[filename]
         return True
     
+    def get_modified_files(self) -> List[str]:
+        """
+        获取所有已修改未保存的文件名列表
+
+        Returns:
+            已修改文件名的列表
+
+        Note:
+            Editor.is_modified只是一个布尔标志，这里的遍历开销
+            与打开的编辑器数量成正比，无需额外的脏标记集合
+        """
+        return [filename for filename, editor in self.editors.items()
+                if editor.is_modified]
+
     def save_session(self) -> None:
         """
         保存当前会话状态到文件
@@ -141,7 +156,7 @@ class Session:
             - 保存所有打开的文件路径
             - 保存当前活动文件
             - 保存每个编辑器的显示设置
-            - 保存到 session.json 文件
+            - 先写入临时文件再原子替换，中途失败不会损坏旧会话文件
         """
         session_data = {
             "files": [],
@@ -158,9 +173,12 @@ class Session:
             if editor == self.active_editor:
                 session_data["active_file"] = filename
         
+        # 紧凑序列化比indent=2快且体积小；会话文件只由程序读取，无需排版
+        tmp_file = self.SESSION_FILE.with_name(self.SESSION_FILE.name + '.tmp')
         try:
-            with open(self.SESSION_FILE, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(session_data, f, separators=(',', ':'))
+            os.replace(tmp_file, self.SESSION_FILE)
         except IOError as e:
             print(f"保存会话状态失败: {str(e)}")
     
@@ -169,28 +187,32 @@ class Session:
         从文件恢复上次会话状态
         
         Note:
-            - 尝试加载上次打开的所有文件
+            - 恢复上次打开的所有文件（延迟解析，首次访问时才加载）
             - 恢复编辑器显示设置
             - 恢复上次的活动文件
             - 如果session.json不存在或损坏，会静默失败
         """
         if not self.SESSION_FILE.exists():
             return
-        
+
         try:
-            with open(self.SESSION_FILE, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
-            
+            # 一次性读入字节交给json.loads：整文件解析无需经过
+            # TextIOWrapper的增量解码器
+            session_data = json.loads(self.SESSION_FILE.read_bytes())
+
             for file_data in session_data["files"]:
                 filepath = Path(file_data["path"])
                 if filepath.exists():
-                    self.load_file(filepath)
-                    editor = self.editors[str(filepath)]
+                    # 只登记编辑器，不立即解析：启动耗时与文件数量
+                    # 成正比，而不是所有文件的总大小
+                    editor = Editor(filepath, defer_load=True)
                     editor.show_id = file_data["show_id"]
-            
+                    self.editors[str(filepath)] = editor
+                    self.active_editor = editor
+
             active_file = session_data.get("active_file")
             if active_file and active_file in self.editors:
                 self.active_editor = self.editors[active_file]
-                
+
         except (IOError, json.JSONDecodeError) as e:
             print(f"恢复会话状态失败: {str(e)}") 
\ No newline at end of file
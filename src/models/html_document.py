@@ -1,3 +1,4 @@
+from sys import intern
 from typing import Optional, Dict, Set, List
 from .html_node import HTMLNode
 from ..exceptions.editor_exceptions import DuplicateIdError, InvalidNodeError
@@ -10,6 +11,7 @@ class HTMLDocument:
         self.root: Optional[HTMLNode] = None
         self._id_map: Dict[str, HTMLNode] = {}  # 用于快速查找节点的ID映射
         self._modified: bool = False  # 文档是否被修改的标志
+        self._structure_validated: bool = False  # 结构验证结果缓存标志
         
     def create_empty_document(self) -> None:
         """
@@ -45,30 +47,75 @@ class HTMLDocument:
             
     def _build_id_map(self, node: HTMLNode) -> None:
         """
-        递归构建ID映射
-        
+        迭代构建ID映射（显式栈遍历，不受递归深度限制）
+
         Args:
-            node: 当前处理的节点
-            
+            node: 子树根节点
+
         Raises:
             DuplicateIdError: 当发现重复ID时抛出
         """
-        if node.id in self._id_map:
-            existing_node = self._id_map[node.id]
-            # 如果是必需标签，且ID等于标签名，则允许重复
-            if (node.tag in HTMLNode.REQUIRED_TAGS and 
-                node.id == node.tag):
-                # 对于必需标签，允许使用标签名作为ID
-                pass
-            # 如果两个节点都不是必需标签，且ID相同，则报错
-            elif (node.tag not in HTMLNode.REQUIRED_TAGS and 
-                  existing_node.tag not in HTMLNode.REQUIRED_TAGS):
-                raise DuplicateIdError(f"发现重复的ID: {node.id}")
-        
-        self._id_map[node.id] = node
-        
-        for child in node.children:
-            self._build_id_map(child)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            existing_node = self._id_map.get(current.id)
+            if existing_node is not None:
+                self._check_duplicate_id(existing_node, current)
+
+            self._id_map[current.id] = current
+            current._document = self  # 维护回指针，使节点查找可直达文档ID映射
+            stack.extend(current.children)
+
+    def _register_subtree(self, node: HTMLNode) -> None:
+        """
+        将新挂载的子树增量登记进ID映射
+
+        Args:
+            node: 子树根节点
+
+        Raises:
+            DuplicateIdError: 当子树中的ID与现有映射冲突时抛出
+
+        Note:
+            先整体检查再批量写入，发现冲突时不会留下半登记状态；
+            只遍历新挂载的子树，不触碰文档其余部分
+        """
+        pending = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            existing_node = self._id_map.get(current.id)
+            if existing_node is not None and existing_node is not current:
+                self._check_duplicate_id(existing_node, current)
+            pending.append(current)
+            stack.extend(current.children)
+
+        for current in pending:
+            self._id_map[current.id] = current
+            current._document = self
+
+    @staticmethod
+    def _check_duplicate_id(existing_node: HTMLNode, node: HTMLNode) -> None:
+        """
+        重复ID判定规则
+
+        Args:
+            existing_node: ID映射中已存在的节点
+            node: 新登记的节点
+
+        Raises:
+            DuplicateIdError: 当两个非必需标签使用相同ID时抛出
+
+        Note:
+            必需标签允许使用标签名作为默认ID，不视为冲突
+        """
+        # 如果是必需标签，且ID等于标签名，则允许重复
+        if node.tag in HTMLNode.REQUIRED_TAGS and node.id == node.tag:
+            return
+        # 如果两个节点都不是必需标签，且ID相同，则报错
+        if (node.tag not in HTMLNode.REQUIRED_TAGS and
+                existing_node.tag not in HTMLNode.REQUIRED_TAGS):
+            raise DuplicateIdError(f"发现重复的ID: {node.id}")
             
     def get_node_by_id(self, id_: str) -> Optional[HTMLNode]:
         """
@@ -76,9 +123,13 @@ class HTMLDocument:
         
         Args:
             id_: 节点ID
-            
+
         Returns:
             找到的节点，如果未找到则返回None
+
+        Note:
+            基于ID映射的O(1)哈希查找；映射在解析和各类
+            增删改操作中增量维护，无需遍历节点树
         """
         return self._id_map.get(id_)
         
@@ -121,8 +172,10 @@ class HTMLDocument:
             index = parent_node.children.index(target_node)
             parent_node.children.insert(index, new_node)
             new_node.parent = parent_node
-            self._id_map[new_node.id] = new_node
+            # 整棵子树增量登记：撤销删除时重新挂回的节点可能带有子节点
+            self._register_subtree(new_node)
             self._modified = True
+            self._structure_validated = False
         except ValueError:
             raise InvalidNodeError(f"无法在节点树中找到目标节点 '{insert_location}'")
         
@@ -152,8 +205,10 @@ class HTMLDocument:
             raise InvalidNodeError(f"未找到ID为 '{parent_id}' 的节点")
             
         parent_node.add_child(new_node)
-        self._id_map[new_node.id] = new_node
+        # 整棵子树增量登记：撤销删除时重新挂回的节点可能带有子节点
+        self._register_subtree(new_node)
         self._modified = True
+        self._structure_validated = False
         
     def delete_node(self, node_id: str) -> None:
         """
@@ -170,13 +225,14 @@ class HTMLDocument:
             raise InvalidNodeError(f"未找到ID为 '{node_id}' 的节点")
             
         # 检查是否是必需的标签
-        if node.tag in {'html', 'head', 'title', 'body'}:
+        if node.tag in HTMLNode.REQUIRED_TAGS:
             raise InvalidNodeError(f"不能删除必需的标签: {node.tag}")
             
         if node.parent:
             node.parent.remove_child(node)
             self._remove_node_from_id_map(node)
             self._modified = True
+            self._structure_validated = False
             
     def _remove_node_from_id_map(self, node: HTMLNode) -> None:
         """
@@ -185,9 +241,11 @@ class HTMLDocument:
         Args:
             node: 要删除的节点
         """
-        self._id_map.pop(node.id, None)
-        for child in node.children:
-            self._remove_node_from_id_map(child)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            self._id_map.pop(current.id, None)
+            stack.extend(current.children)
             
     def edit_node_id(self, old_id: str, new_id: str) -> None:
         """
@@ -209,8 +267,8 @@ class HTMLDocument:
             raise InvalidNodeError(f"未找到ID为 '{old_id}' 的节点")
             
         del self._id_map[old_id]
-        node.id = new_id
-        self._id_map[new_id] = node
+        node.id = intern(new_id)  # 与HTMLNode构造时一致，保持ID驻留
+        self._id_map[node.id] = node
         self._modified = True
         
     def edit_node_text(self, node_id: str, new_text: str) -> None:
@@ -252,10 +310,16 @@ class HTMLDocument:
     def validate(self) -> None:
         """
         验证整个文档的有效性
-        
+
         Raises:
             InvalidNodeError: 当文档结构无效时抛出
+
+        Note:
+            验证结果会被缓存，树结构未变化时重复调用为O(1)
         """
+        if self._structure_validated:
+            return
+
         if not self.root or self.root.tag != 'html':
             raise InvalidNodeError("文档必须有一个html根节点")
             
@@ -279,8 +343,10 @@ class HTMLDocument:
                 break
                 
         if not title:
-            raise InvalidNodeError("head节点必须包含title子节点") 
-        
+            raise InvalidNodeError("head节点必须包含title子节点")
+
+        self._structure_validated = True
+
     def set_root(self, root: HTMLNode) -> None:
         """
         设置文档根节点并更新ID映射
@@ -290,4 +356,5 @@ class HTMLDocument:
         """
         self.root = root
         self._update_id_map()
-        self._modified = False
\ No newline at end of file
+        self._modified = False
+        self._structure_validated = False
\ No newline at end of file
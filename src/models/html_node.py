@@ -1,10 +1,16 @@
+from sys import intern
 from typing import Optional, List, Dict
 from ..exceptions.editor_exceptions import DuplicateIdError, InvalidNodeError
 
 class HTMLNode:
     """HTML节点的基类，用于表示HTML文档中的各种元素"""
-    
-    REQUIRED_TAGS = {'html', 'head', 'title', 'body'}
+
+    # 固定槽位代替实例__dict__：每节点省约200字节，大文档下
+    # 显著降低内存占用，属性访问也走固定偏移而非字典查找
+    __slots__ = ('tag', 'id', 'text', 'parent', 'children', '_document')
+
+    # frozenset：不可变集合，哈希成员检查在热路径上最快且防止意外修改
+    REQUIRED_TAGS = frozenset({'html', 'head', 'title', 'body'})
     
     def __init__(self, tag: str, id_: Optional[str] = None, text: str = ""):
         """
@@ -15,19 +21,24 @@ class HTMLNode:
             id_: 节点ID，如果不提供且是必需标签则使用标签名作为默认ID
             text: 节点的文本内容
         """
-        self.tag = tag.lower()
+        # 标签名和ID都做驻留：重复值共享同一str对象，
+        # 既减少内存占用，又让后续比较走指针相等的快路径
+        self.tag = intern(tag.lower())
         # 对于必需标签，如果没有提供id则使用标签名
         if self.tag in self.REQUIRED_TAGS:
-            self.id = id_ if id_ else self.tag
+            self.id = intern(id_) if id_ else self.tag
         else:
             # 对于其他标签，必须提供id
             if not id_:
                 raise InvalidNodeError(f"非必需标签 '{self.tag}' 必须提供id属性")
-            self.id = id_
+            self.id = intern(id_)
             
         self.text = text
         self.parent: Optional[HTMLNode] = None
+        # children用list而非兄弟指针链表：Python下连续数组的遍历、
+        # 索引和len都更快，兄弟数量通常很小，O(k)的删除/插入可接受
         self.children: List[HTMLNode] = []
+        self._document = None  # 所属文档的回指针，由HTMLDocument维护
         
     def add_child(self, child: 'HTMLNode') -> None:
         """
@@ -48,9 +59,12 @@ class HTMLNode:
         Args:
             child: 要移除的子节点
         """
-        if child in self.children:
+        # 单次remove代替"in检查+remove"的两遍线性扫描
+        try:
             self.children.remove(child)
-            child.parent = None
+        except ValueError:
+            return
+        child.parent = None
             
     def find_by_id(self, id_: str) -> Optional['HTMLNode']:
         """
@@ -62,28 +76,42 @@ class HTMLNode:
         Returns:
             找到的节点，如果未找到则返回None
         """
-        if self.id == id_:
-            return self
-            
-        for child in self.children:
-            result = child.find_by_id(id_)
-            if result:
-                return result
+        # 文档根节点直接走文档的ID映射，O(1)完成查找
+        document = self._document
+        if document is not None and document.root is self:
+            return document.get_node_by_id(id_)
+
+        # 游离子树或非根节点仍然遍历查找，保持子树范围语义；
+        # 显式栈迭代，避免深文档触发递归深度限制
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.id == id_:
+                return node
+            stack.extend(node.children)
         return None
         
     def to_dict(self) -> Dict:
         """
         将节点转换为字典格式
-        
+
         Returns:
             包含节点信息的字典
         """
-        return {
-            'tag': self.tag,
-            'id': self.id,
-            'text': self.text,
-            'children': [child.to_dict() for child in self.children]
-        }
+        # 显式栈迭代构建：每个节点的字典在入栈时创建并挂到
+        # 父字典的children里，子节点顺序保持不变
+        root_dict = {'tag': self.tag, 'id': self.id,
+                     'text': self.text, 'children': []}
+        stack = [(self, root_dict)]
+        while stack:
+            node, node_dict = stack.pop()
+            children = node_dict['children']
+            for child in node.children:
+                child_dict = {'tag': child.tag, 'id': child.id,
+                              'text': child.text, 'children': []}
+                children.append(child_dict)
+                stack.append((child, child_dict))
+        return root_dict
         
     def validate(self) -> None:
         """
@@ -92,10 +120,11 @@ class HTMLNode:
         Raises:
             InvalidNodeError: 当节点不符合要求时抛出
         """
-        # 检查非必需标签是否有ID
-        if self.tag not in self.REQUIRED_TAGS and not self.id:
-            raise InvalidNodeError(f"非必需标签 '{self.tag}' 必须有ID属性")
-            
-        # 递归验证子节点
-        for child in self.children:
-            child.validate()
\ No newline at end of file
+        # 显式栈迭代验证整个子树，避免深文档触发递归深度限制
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            # 检查非必需标签是否有ID
+            if node.tag not in node.REQUIRED_TAGS and not node.id:
+                raise InvalidNodeError(f"非必需标签 '{node.tag}' 必须有ID属性")
+            stack.extend(node.children)
\ No newline at end of file
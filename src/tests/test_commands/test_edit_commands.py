@@ -1,3 +1,4 @@
+import copy
 import pytest
 from src.commands.edit_commands import (
     InsertCommand, AppendCommand, DeleteCommand,
@@ -6,22 +7,28 @@ from src.commands.edit_commands import (
 from src.models.html_document import HTMLDocument
 from src.utils.html_parser import HTMLParser
 
+@pytest.fixture(scope="module")
+def parsed_template():
+    """整个测试模块只解析一次的文档模板"""
+    html_content = """
+    <html>
+        <head>
+            <title>Test Page</title>
+        </head>
+        <body>
+            <div id="content">
+                <p id="para1">Original text</p>
+            </div>
+        </body>
+    </html>
+    """
+    return HTMLParser.parse_html(html_content)
+
 class TestEditCommands:
     @pytest.fixture
-    def sample_document(self):
-        html_content = """
-        <html>
-            <head>
-                <title>Test Page</title>
-            </head>
-            <body>
-                <div id="content">
-                    <p id="para1">Original text</p>
-                </div>
-            </body>
-        </html>
-        """
-        return HTMLParser.parse_html(html_content)
+    def sample_document(self, parsed_template):
+        """每个测试拿到模板的深拷贝，互不影响"""
+        return copy.deepcopy(parsed_template)
 
     def test_insert_command(self, sample_document):
         """测试插入命令"""
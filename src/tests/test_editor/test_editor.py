@@ -1,28 +1,37 @@
+import copy
 import pytest
 from pathlib import Path
 from src.editor.editor import Editor
 from src.commands.edit_commands import EditTextCommand
+from src.commands.io_commands import ReadCommand
 from src.commands.command import Command
+from src.utils.html_parser import HTMLParser
+
+SAMPLE_HTML = """
+<html>
+    <head><title>Test</title></head>
+    <body><p id="test">Original content</p></body>
+</html>
+"""
+
+@pytest.fixture(scope="module")
+def parsed_template():
+    """整个测试模块只解析一次的文档模板"""
+    return HTMLParser.parse_html(SAMPLE_HTML)
 
 class TestEditor:
     @pytest.fixture
     def sample_html_file(self, tmp_path):
         """创建示例HTML文件"""
         html_file = tmp_path / "test.html"
-        html_content = """
-        <html>
-            <head><title>Test</title></head>
-            <body><p id="test">Original content</p></body>
-        </html>
-        """
-        html_file.write_text(html_content)
+        html_file.write_text(SAMPLE_HTML)
         return html_file
 
     @pytest.fixture
-    def editor(self, sample_html_file):
-        """创建编辑器实例"""
+    def editor(self, parsed_template, sample_html_file):
+        """创建编辑器实例（复用已解析的模板，跳过重复解析）"""
         editor = Editor()
-        editor.load_file(sample_html_file)
+        editor.load_document(copy.deepcopy(parsed_template), sample_html_file)
         return editor
 
     def test_load_document(self, editor):
@@ -103,9 +112,9 @@ class TestEditor:
         # 测试保存到无效路径
         assert not editor.save_file(Path("/invalid/path/file.html"))
         
-        # 测试执行无效命令
-        invalid_command = Command()  # 基础命令
-        assert not editor.execute_command(invalid_command)
+        # 测试实例化抽象基础命令
+        with pytest.raises(TypeError):
+            Command()  # 抽象方法未实现，不能实例化
 
     def test_editor_state_management(self, editor):
         """测试编辑器状态管理"""
@@ -121,6 +130,41 @@ class TestEditor:
         editor._clear_command_stacks()
         assert not editor.undo()  # 清空后应该无法撤销
 
+    def test_non_undoable_command_refreshes_views(self, editor, tmp_path):
+        """测试不可撤销的IO命令执行后视图缓存失效"""
+        old_view = editor.get_tree_view()
+
+        other_file = tmp_path / "other.html"
+        other_file.write_text("""
+        <html>
+            <head><title>Other</title></head>
+            <body><p id="replaced">Replaced content</p></body>
+        </html>
+        """)
+        assert editor.execute_command(ReadCommand(editor.document, other_file))
+
+        new_view = editor.get_tree_view()
+        assert new_view != old_view
+        assert 'replaced' in new_view
+
+    def test_modified_after_history_truncation(self, parsed_template,
+                                               sample_html_file, monkeypatch):
+        """测试历史被截断后撤销到栈空仍保持修改标志"""
+        monkeypatch.setattr(Editor, 'MAX_HISTORY', 3)
+        editor = Editor()
+        editor.load_document(copy.deepcopy(parsed_template), sample_html_file)
+
+        # 执行超出历史上限的命令，最旧的一条被淘汰
+        for i in range(4):
+            command = EditTextCommand(editor.document, 'test', f'v{i}')
+            assert editor.execute_command(command)
+
+        # 撤销到栈空：文档停在v0而非加载时的内容，仍是已修改状态
+        while editor.undo():
+            pass
+        assert editor.document.root.find_by_id('test').text == 'v0'
+        assert editor.is_modified
+
     def test_editor_multiple_operations(self, editor):
         """测试编辑器多重操作"""
         # 执行多个命令并验证状态
@@ -55,6 +55,23 @@ class TestSession:
         doc = session.active_editor.document
         assert doc.root.find_by_id('test').text == 'Test content'
 
+    def test_load_file_parses_once(self, sample_html_file, monkeypatch):
+        """测试加载文件时只解析一次"""
+        from src.utils.html_parser import HTMLParser
+
+        call_count = {'count': 0}
+        original_parse_file = HTMLParser.parse_file
+
+        def counting_parse_file(filepath):
+            call_count['count'] += 1
+            return original_parse_file(filepath)
+
+        monkeypatch.setattr(HTMLParser, 'parse_file', staticmethod(counting_parse_file))
+
+        session = Session()
+        assert session.load_file(sample_html_file)
+        assert call_count['count'] == 1
+
     def test_switch_editor(self, sample_html_file, tmp_path):
         """测试切换编辑器"""
         session = Session()
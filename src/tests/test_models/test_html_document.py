@@ -57,6 +57,16 @@ class TestHTMLDocument:
             body.add_child(div2)
             sample_document._update_id_map()
 
+    def test_append_subtree_registers_descendants(self, sample_document):
+        """测试追加带子节点的子树时后代ID也被登记"""
+        parent = HTMLNode('div', 'parent-div')
+        child = HTMLNode('span', 'child-span')
+        parent.add_child(child)
+
+        sample_document.append_node(parent, 'body')
+        assert sample_document.get_node_by_id('parent-div') == parent
+        assert sample_document.get_node_by_id('child-span') == child
+
     def test_required_tags_same_id(self, sample_document):
         """测试必需标签使用相同ID"""
         # html和head标签使用标签名作为ID是允许的
@@ -1,6 +1,8 @@
+import sys
 import pytest
 from src.utils.html_parser import HTMLParser
 from src.models.html_document import HTMLDocument
+from src.models.html_node import HTMLNode
 from src.exceptions.editor_exceptions import InvalidNodeError
 
 class TestHTMLParser:
@@ -59,6 +61,21 @@ class TestHTMLParser:
         assert '<div id="content">' in html_string
         assert '<p id="para1">Hello World</p>' in html_string
 
+    def test_to_html_string_deep_document(self):
+        """测试深层嵌套文档的序列化不受递归深度限制"""
+        document = HTMLDocument()
+        document.create_empty_document()
+        depth = sys.getrecursionlimit() + 100
+        parent_id = 'body'
+        for i in range(depth):
+            document.append_node(HTMLNode('div', f'd{i}'), parent_id)
+            parent_id = f'd{i}'
+
+        html_string = HTMLParser.to_html_string(document)
+        assert '<div id="d0">' in html_string
+        assert f'<div id="d{depth - 1}">' in html_string
+        assert html_string.count('</div>') == depth
+
     def test_to_tree_string(self, valid_html):
         """测试生成树形结构字符串"""
         document = HTMLParser.parse_html(valid_html)
@@ -62,6 +62,42 @@ class TestSpellChecker:
         assert 'test' not in errors or not any('css' in str(error) for error in errors.get('test', []))
         assert 'test' not in errors or not any('html' in str(error) for error in errors.get('test', []))
 
+    def test_cache_isolated_by_ignored_words(self):
+        """测试缓存结果不在忽略词集合不同的实例间串用"""
+        html_content = """
+        <html>
+            <head><title>Test</title></head>
+            <body>
+                <p id="test">helllo world</p>
+            </body>
+        </html>
+        """
+        document = HTMLParser.parse_html(html_content)
+
+        checker_a = SpellChecker()
+        checker_a.add_ignored_word('helllo')
+        assert 'test' not in checker_a.check_document(document)
+
+        # 新实例没有忽略helllo，不应命中上面的缓存结果
+        checker_b = SpellChecker()
+        assert 'test' in checker_b.check_document(document)
+
+    def test_errors_in_document_order(self, spell_checker):
+        """测试错误报告按文档顺序排列"""
+        html_content = """
+        <html>
+            <head><title>Test</title></head>
+            <body>
+                <p id="a">misspeled</p>
+                <p id="b">incorrekt</p>
+                <p id="c">wrnog</p>
+            </body>
+        </html>
+        """
+        document = HTMLParser.parse_html(html_content)
+        errors = spell_checker.check_document(document)
+        assert list(errors.keys()) == ['a', 'b', 'c']
+
     def test_empty_document(self, spell_checker):
         """测试空文档"""
         document = HTMLDocument()
@@ -1,10 +1,32 @@
 from typing import Optional, Tuple, Dict, List, Any
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
 from ..models.html_document import HTMLDocument
 from ..models.html_node import HTMLNode
 from ..exceptions.editor_exceptions import InvalidNodeError
 from .tree_printer import HTMLPrinter
 
+# 直接复用lxml(libxml2)的C解析器，省去BeautifulSoup在其上
+# 再构建一层Python树的开销；解析器对象可安全复用。
+# remove_blank_text在C层丢弃纯空白文本节点，省去Python侧的strip
+_LXML_PARSER = etree.HTMLParser(remove_blank_text=True)
+_LXML_FILE_PARSER = etree.HTMLParser(encoding='utf-8', remove_blank_text=True)
+
+# HTML转义表：str.translate一次遍历完成全部替换，
+# 比链式str.replace的多遍扫描快且不产生中间字符串
+_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# 各层级缩进字符串缓存：同层节点共享同一str对象，
+# 避免序列化时每个节点都重新构造一份空白前缀
+_PADDING_CACHE: Dict[int, str] = {}
+
+def _padding(width: int) -> str:
+    """返回指定宽度的缩进字符串（带缓存）"""
+    cached = _PADDING_CACHE.get(width)
+    if cached is None:
+        cached = " " * width
+        _PADDING_CACHE[width] = cached
+    return cached
+
 class HTMLParser:
     """HTML解析工具类，负责HTML字符串和HTMLDocument对象之间的转换"""
     
@@ -23,88 +45,206 @@ class HTMLParser:
             InvalidNodeError: 当HTML结构无效时抛出
         """
         # 使用lxml解析器解析HTML
-        soup = BeautifulSoup(html_content, 'lxml')
-        
+        try:
+            root = etree.fromstring(html_content, _LXML_PARSER)
+        except etree.XMLSyntaxError:
+            root = None
+        return HTMLParser._document_from_root(root)
+
+    @staticmethod
+    def parse_file(filepath) -> HTMLDocument:
+        """
+        直接从文件解析HTML文档
+
+        Args:
+            filepath: HTML文件路径
+
+        Returns:
+            HTMLDocument对象
+
+        Raises:
+            InvalidNodeError: 当HTML结构无效时抛出
+
+        Note:
+            文件句柄直接交给lxml流式读取，调用方无需先把
+            全文读成字符串，解析期间内存中只保留一份文档内容
+        """
+        # 128KiB缓冲区：整文件读取时减少系统调用次数
+        try:
+            with open(filepath, 'rb', buffering=131072) as f:
+                root = etree.parse(f, _LXML_FILE_PARSER).getroot()
+        except etree.XMLSyntaxError:
+            root = None
+        return HTMLParser._document_from_root(root)
+
+    @staticmethod
+    def _document_from_root(root) -> HTMLDocument:
+        """
+        从lxml解析结果构建HTMLDocument
+
+        Args:
+            root: lxml解析得到的根元素
+
+        Returns:
+            HTMLDocument对象
+
+        Raises:
+            InvalidNodeError: 当HTML结构无效时抛出
+        """
         # 确保有html标签
-        html_tag = soup.find('html')
-        if not html_tag:
+        if root is None or root.tag != 'html':
             raise InvalidNodeError("HTML文档必须包含html根标签")
-            
+
+        # 解析时同步登记ID映射，省去解析后对整棵树的第二次遍历
         document = HTMLDocument()
-        document.root = HTMLParser._parse_node(html_tag)
-        
-        # 验证文档结构
+        duplicates = []
+        document.root = HTMLParser._parse_node(root, document, duplicates)
+
+        # 验证文档结构；重复ID在结构验证之后统一检查，保持原有的报错优先级
         document.validate()
+        for existing_node, node in duplicates:
+            HTMLDocument._check_duplicate_id(existing_node, node)
         document.set_unmodified()
-        document._update_id_map()
-        
+
         return document
-        
+
     @staticmethod
-    def _parse_node(bs_tag: Tag) -> HTMLNode:
+    def _parse_node(element, document: Optional[HTMLDocument] = None,
+                    duplicates: Optional[List] = None) -> HTMLNode:
         """
-        递归解析BeautifulSoup标签为HTMLNode对象
-        
+        递归解析lxml元素为HTMLNode对象
+
         Args:
-            bs_tag: BeautifulSoup的Tag对象
-            
+            element: lxml元素对象
+            document: 所属文档，提供时边解析边登记ID映射
+            duplicates: 收集(已存在节点, 新节点)冲突对的列表，由调用方统一检查
+
         Returns:
             HTMLNode对象
         """
         # 获取标签名
-        tag_name = bs_tag.name
-        
+        tag_name = element.tag
+
         # 获取ID属性
-        node_id = bs_tag.get('id')
-        
+        node_id = element.get('id')
+
         # 如果是必需标签且没有指定ID，则使用标签名作为ID
         if tag_name in HTMLNode.REQUIRED_TAGS and not node_id:
             node_id = tag_name
-        
+
         # 提取直接文本内容（不包括子标签中的文本）
-        text_content = HTMLParser._extract_direct_text(bs_tag)
-        
+        text_content = HTMLParser._extract_direct_text(element)
+
         # 创建节点
         node = HTMLNode(tag_name, node_id, text_content)
-        
-        # 递归处理子节点
-        for child in bs_tag.children:
-            if isinstance(child, Tag):
-                child_node = HTMLParser._parse_node(child)
+
+        # 边解析边登记ID映射，冲突对先收集、由调用方统一检查
+        if document is not None:
+            existing_node = document._id_map.get(node.id)
+            if existing_node is not None and duplicates is not None:
+                duplicates.append((existing_node, node))
+            document._id_map[node.id] = node
+            node._document = document
+
+        # 递归处理子节点（注释/处理指令的tag不是字符串，跳过）
+        for child in element:
+            if isinstance(child.tag, str):
+                child_node = HTMLParser._parse_node(child, document, duplicates)
                 node.add_child(child_node)
-                
+
         return node
-        
+
     @staticmethod
-    def _extract_direct_text(tag: Tag) -> str:
+    def _extract_direct_text(element) -> str:
         """
-        提取标签的直接文本内容（不包括子标签中的文本）
-        
+        提取元素的直接文本内容（不包括子标签中的文本）
+
         Args:
-            tag: BeautifulSoup的Tag对象
-            
+            element: lxml元素对象
+
         Returns:
             直接文本内容
         """
-        return ''.join(child.strip() for child in tag.strings 
-                      if child.parent == tag and child.strip())
+        # 直接文本 = 开标签后的text + 各子元素闭标签后的tail
+        parts = []
+        if element.text and element.text.strip():
+            parts.append(element.text.strip())
+        for child in element:
+            if child.tail and child.tail.strip():
+                parts.append(child.tail.strip())
+        return ''.join(parts)
         
+    @staticmethod
+    def iter_html_lines(document: HTMLDocument, indent: int = 2):
+        """
+        逐行生成文档的格式化HTML输出
+
+        Args:
+            document: HTMLDocument对象
+            indent: 缩进空格数
+
+        Yields:
+            格式化HTML的每一行（含换行符），可直接writelines到文件，
+            避免为大文档构造完整字符串
+        """
+        if not document.root:
+            return
+        yield from HTMLParser._iter_node_lines(document.root, 0, indent)
+
+    @staticmethod
+    def _iter_node_lines(node: HTMLNode, level: int, indent: int):
+        """
+        生成单个节点及其子树的HTML行
+
+        使用显式栈迭代遍历：深层文档不受递归深度限制，每行都
+        直接从循环体yield，省去逐层generator帧转发的开销。
+        闭标签行以字符串哨兵入栈，弹出时原样输出。
+
+        Args:
+            node: 当前节点
+            level: 当前嵌套层级
+            indent: 每级缩进空格数
+        """
+        stack: List[Any] = [(node, level)]
+        while stack:
+            entry = stack.pop()
+            if isinstance(entry, str):
+                yield entry  # 闭标签哨兵
+                continue
+
+            current, cur_level = entry
+            padding = _padding(cur_level * indent)
+            # 必需标签默认使用标签名作为ID，此时不输出id属性
+            id_attr = (f' id="{current.id.translate(_ESCAPE_TABLE)}"'
+                       if current.id != current.tag else "")
+            text = current.text.translate(_ESCAPE_TABLE) if current.text else ""
+
+            if not current.children:
+                yield f"{padding}<{current.tag}{id_attr}>{text}</{current.tag}>\n"
+                continue
+
+            yield f"{padding}<{current.tag}{id_attr}>\n"
+            if text:
+                yield f"{padding}{_padding(indent)}{text}\n"
+            # 闭标签先入栈，子节点倒序入栈保持文档顺序
+            stack.append(f"{padding}</{current.tag}>\n")
+            child_level = cur_level + 1
+            for child in reversed(current.children):
+                stack.append((child, child_level))
+
     @staticmethod
     def to_html_string(document: HTMLDocument, indent: int = 2) -> str:
         """
         将HTMLDocument对象转换为格式化的HTML字符串
-        
+
         Args:
             document: HTMLDocument对象
             indent: 缩进空格数
-            
+
         Returns:
             格式化的HTML字符串
         """
-        if not document.root:
-            return ""
-        printer = HTMLPrinter()
-        return printer.get_indented_view(document.root, indent)
+        return "".join(HTMLParser.iter_html_lines(document, indent))
         
     @staticmethod
     def to_tree_string(document: HTMLDocument, show_id: bool = True, 
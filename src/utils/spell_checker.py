@@ -1,55 +1,104 @@
-from typing import Dict, List, Set, Any
+from typing import Dict, FrozenSet, List, Optional, Any
 from spellchecker import SpellChecker as PySpellChecker
 from ..models.html_document import HTMLDocument
 from ..models.html_node import HTMLNode
 import re
 
+# 模块级预编译正则：省去每次调用时re模块的模式缓存查找
+_RE_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')  # 日期格式
+_RE_TRAIL_PUNCT = re.compile(r'[.,:;]$')  # 末尾多余标点
+_RE_HAS_UPPER = re.compile(r'[A-Z]')  # 驼峰词判定
+_RE_CAMEL_SPLIT = re.compile(r'[A-Z][^A-Z]*|[^A-Z]+')  # 驼峰词拆分
+# 单词分词：一趟C级扫描同时完成分词、去标点和去纯数字，
+# 连字符和撇号保留在词内（复合词在_expand_word中拆分）
+_RE_TOKENIZE = re.compile(r"[A-Za-z][A-Za-z'-]*")
+
+# 删除特殊符号（版权符号等）用translate：单趟C循环，无需正则引擎
+_STRIP_TABLE = str.maketrans('', '', '©®™')
+
 class SpellChecker:
     """HTML文档拼写检查工具"""
-    
+
+    # 按(文本, 忽略词集合)缓存检查结果，供所有实例共享
+    # （PrintTreeCommand和SpellCheckCommand各自创建实例；忽略词集合
+    # 是实例状态，必须进入键中，否则结果会在不同实例间串用）
+    _text_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+    _TEXT_CACHE_LIMIT = 1024  # 超过上限时整体清空，防止长会话中无限增长
+
+    # 拼写建议缓存：candidates要生成编辑距离邻域，是最贵的调用；
+    # 结果只取决于词典，忽略词变化也无需失效
+    _candidates_cache: Dict[str, Any] = {}
+
+    # 底层词典检查器共享：PySpellChecker构造时要加载整个英文
+    # 词典（约数十MB），所有实例只读使用，加载一次即可
+    _shared_checker: Optional[PySpellChecker] = None
+
     def __init__(self):
         """初始化拼写检查器"""
-        self.checker = PySpellChecker()
-        self.ignored_words: Set[str] = {
+        if SpellChecker._shared_checker is None:
+            SpellChecker._shared_checker = PySpellChecker()
+        self.checker = SpellChecker._shared_checker
+        # frozenset：忽略词查询远多于增删，增删时整体重建即可
+        self.ignored_words: FrozenSet[str] = frozenset({
             'div', 'html', 'css', 'js',  # HTML相关术语
             'webpage', 'website', 'online',  # Web相关术语
             'com', 'org', 'net',  # 常见域名后缀
-        }
+        })
     
-    def check_document(self, document: HTMLDocument) -> Dict[str, List[Dict[str, Any]]]:
+    def check_document(self, document: HTMLDocument,
+                       max_errors: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         检查整个文档的拼写
-        
+
         Args:
             document: HTML文档
-            
+            max_errors: 错误条数上限，达到后提前结束遍历；
+                None（默认）表示检查全部节点
+
         Returns:
             错误报告，格式为：{节点ID: [{错误类型, 原文本, 建议修正}]}
         """
         if not document.root:
             return {}
-        
+
         errors = {}
-        self._check_node(document.root, errors)
+        error_count = 0
+        # 显式栈迭代遍历，避免深文档触发递归深度限制
+        stack = [document.root]
+        while stack:
+            node = stack.pop()
+            error_count += self._check_node(node, errors)
+            if max_errors is not None and error_count >= max_errors:
+                break
+            # 倒序入栈保持文档顺序，错误报告与递归版本一致
+            stack.extend(reversed(node.children))
         return errors
-    
-    def _check_node(self, node: HTMLNode, errors: Dict[str, List[Dict[str, Any]]]) -> None:
+
+    def _check_node(self, node: HTMLNode, errors: Dict[str, List[Dict[str, Any]]]) -> int:
         """
-        递归检查节点的拼写错误
-        
+        检查单个节点的拼写错误
+
         Args:
             node: HTML节点
             errors: 错误收集字典
+
+        Returns:
+            该节点新增的错误条数
         """
         if node.text:
-            # 检查节点的文本内容
-            text_errors = self._check_text(node.text)
+            # 优先复用缓存的检查结果，未命中时才进行真正的拼写检查；
+            # ignored_words是frozenset，可直接作为键的一部分
+            cache_key = (node.text, self.ignored_words)
+            text_errors = self._text_cache.get(cache_key)
+            if text_errors is None:
+                text_errors = self._check_text(node.text)
+                if len(self._text_cache) >= self._TEXT_CACHE_LIMIT:
+                    self._text_cache.clear()
+                self._text_cache[cache_key] = text_errors
             if text_errors:
                 errors[node.id] = text_errors
-        
-        # 递归检查子节点
-        for child in node.children:
-            self._check_node(child, errors)
+                return len(text_errors)
+        return 0
     
     def _check_text(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -70,23 +119,34 @@ class SpellChecker:
             sentence = sentence.strip()
             if not sentence:
                 continue
-            
-            # 分词并过滤特殊字符
-            words = [word.strip('.,!?:;()[]{}') for word in sentence.split()]
-            words = [word for word in words if word and not word.isdigit()]
-            
-            # 检查每个单词
-            misspelled = set()
+
+            # 一趟正则扫描完成分词：标点和纯数字被模式本身排除
+            words = _RE_TOKENIZE.findall(sentence)
+
+            # 先把复合词/驼峰词展开成基础部分，再一次性批量查询：
+            # pyspellchecker的unknown本身就是集合运算，整句一次调用
+            # 代替逐词往返的N次规范化和字典查找
+            word_parts: Dict[str, List[str]] = {}
+            candidates = set()
             for word in words:
-                if word not in self.ignored_words and not self._check_word(word):
-                    misspelled.add(word)
-            
+                # 忽略词统一按小写比对，'CSS'等大写写法同样命中
+                if word.lower() in self.ignored_words:
+                    continue
+                parts = [part for part in self._expand_word(word)
+                         if part not in self.ignored_words]
+                word_parts[word] = parts
+                candidates.update(parts)
+
+            missing = self.checker.unknown(candidates) if candidates else set()
+            misspelled = {word for word, parts in word_parts.items()
+                          if any(part in missing for part in parts)}
+
             if misspelled:
                 error_info = {
                     'type': 'spelling',
                     'text': sentence,
                     'misspelled': list(misspelled),
-                    'suggestions': {word: self.checker.candidates(word) 
+                    'suggestions': {word: self._get_candidates(word)
                                   for word in misspelled}
                 }
                 if error_info['suggestions']:
@@ -94,6 +154,25 @@ class SpellChecker:
         
         return errors
     
+    def _get_candidates(self, word: str) -> Any:
+        """
+        获取单词的拼写建议（带缓存）
+
+        Args:
+            word: 拼错的单词
+
+        Returns:
+            建议修正的候选集合
+        """
+        if word in self._candidates_cache:
+            return self._candidates_cache[word]
+
+        candidates = self.checker.candidates(word)
+        if len(self._candidates_cache) >= self._TEXT_CACHE_LIMIT:
+            self._candidates_cache.clear()
+        self._candidates_cache[word] = candidates
+        return candidates
+
     def add_ignored_word(self, word: str) -> None:
         """
         添加忽略的单词
@@ -101,18 +180,25 @@ class SpellChecker:
         Args:
             word: 要忽略的单词
         """
-        self.ignored_words.add(word.lower()) 
-    
+        # 缓存键包含忽略词集合，旧集合的条目自然不再命中，无需清空
+        self.ignored_words = self.ignored_words | {word.lower()}
+
     def remove_ignored_word(self, word: str) -> None:
         """
         移除忽略的单词
         
         Args:
             word: 要移除的单词
+
+        Raises:
+            KeyError: 当单词不在忽略列表中时抛出
         """
-        self.ignored_words.remove(word.lower())
+        lowered = word.lower()
+        if lowered not in self.ignored_words:
+            raise KeyError(lowered)
+        self.ignored_words = self.ignored_words - {lowered}
     
-    def get_ignored_words(self) -> Set[str]:
+    def get_ignored_words(self) -> FrozenSet[str]:
         """
         获取所有被忽略的单词
         
@@ -132,32 +218,55 @@ class SpellChecker:
             处理后的文本
         """
         # 移除特殊符号（版权符号等）
-        text = re.sub(r'[©®™]', '', text)
+        text = text.translate(_STRIP_TABLE)
         # 处理日期格式
-        text = re.sub(r'\d{4}-\d{2}-\d{2}', '', text)
+        text = _RE_DATE.sub('', text)
         # 移除多余的标点符号
-        text = re.sub(r'[.,:;]$', '', text)
-        # 保留连字符（因为在_check_word中会处理）
+        text = _RE_TRAIL_PUNCT.sub('', text)
+        # 保留连字符（因为在_expand_word中会处理）
         return text
     
+    def _expand_word(self, word: str) -> List[str]:
+        """
+        把单词展开为待查的基础部分（小写）
+
+        Args:
+            word: 要展开的单词
+
+        Returns:
+            基础单词部分的列表：复合词按连字符拆开，
+            驼峰词（如 MyWebpage）按大写边界拆开，普通单词原样小写
+        """
+        # 快路径：全小写且无连字符是英文语料的绝大多数情况，
+        # 一次C级islower判断即可跳过后面的正则匹配
+        if word.islower() and '-' not in word:
+            return [word]
+
+        # 复合词（包含连字符）
+        if '-' in word:
+            parts: List[str] = []
+            for part in word.split('-'):
+                parts.extend(self._expand_word(part))
+            return parts
+
+        # 驼峰命名的复合词（如 MyWebpage）
+        if _RE_HAS_UPPER.search(word, 1):
+            return [part.lower()
+                    for part in _RE_CAMEL_SPLIT.findall(word)]
+
+        # 普通单词
+        return [word.lower()]
+
     def _check_word(self, word: str) -> bool:
         """
-        递归检查单词拼写是否正确
-        
+        检查单词拼写是否正确
+
         Args:
             word: 要检查的单词
-            
+
         Returns:
             拼写是否正确
         """
-        # 检查是否是复合词（包含连字符）
-        if '-' in word:
-            return all(self._check_word(part) for part in word.split('-'))
-            
-        # 检查驼峰命名的复合词（如 MyWebpage）
-        elif re.search(r'[A-Z]', word[1:]):
-            parts = re.findall('[A-Z][^A-Z]*|[^A-Z]+', word)
-            return all(self._check_word(part.lower()) for part in parts)
-            
-        # 检查普通单词
-        return word.lower() in self.ignored_words or not self.checker.unknown([word.lower()])
\ No newline at end of file
+        parts = [part for part in self._expand_word(word)
+                 if part not in self.ignored_words]
+        return not parts or not self.checker.unknown(parts)
\ No newline at end of file
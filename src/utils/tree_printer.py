@@ -1,3 +1,4 @@
+import os
 from abc import ABC, abstractmethod
 from typing import List, Set, Any, Optional, Dict
 from pathlib import Path
@@ -27,51 +28,69 @@ class TreePrinter(ABC):
         pass
 
     def get_tree_view(self, root: Any) -> str:
-        """生成树形视图"""
-        lines = []
-        lines.append(f"{self.get_root_name(root)}\n")
-        
-        children = self.get_children(root)
-        for i, child in enumerate(children):
-            if self.should_skip_node(child):
-                continue
-            is_last = (i == len(children) - 1)
-            self._build_tree(child, "", is_last, lines)
-            
+        """
+        生成树形视图
+
+        使用显式栈迭代遍历代替递归：深层文档不再受递归深度限制，
+        也省去了每个节点一次函数调用的解释器开销。先过滤再判断
+        最后一个兄弟节点，保证被跳过的节点不影响连接线的形状。
+        子级前缀只在确有可见子节点时拼接一次，同层兄弟共享同一
+        前缀字符串对象。
+        """
+        lines = [f"{self.get_root_name(root)}\n"]
+        append = lines.append
+        build_display_name = self.build_display_name
+
+        # 栈元素：(节点, 前缀, 是否为最后一个可见兄弟)，倒序入栈保持输出顺序
+        children = [child for child in self.get_children(root)
+                    if not self.should_skip_node(child)]
+        last_index = len(children) - 1
+        stack: List[Any] = [(children[i], "", i == last_index)
+                            for i in range(last_index, -1, -1)]
+
+        while stack:
+            node, prefix, is_last = stack.pop()
+            connector = "└── " if is_last else "├── "
+            append(f"{prefix}{connector}{build_display_name(node)}\n")
+
+            children = [child for child in self.get_children(node)
+                        if not self.should_skip_node(child)]
+            if children:
+                child_prefix = prefix + ("    " if is_last else "│   ")
+                last_index = len(children) - 1
+                for i in range(last_index, -1, -1):
+                    stack.append((children[i], child_prefix, i == last_index))
+
         return "".join(lines)
-    
-    def _build_tree(self, node: Any, prefix: str, is_last: bool, lines: List[str]) -> None:
-        """递归构建树形结构"""
-        connector = "└── " if is_last else "├── "
-        display_name = self.build_display_name(node)
-        lines.append(f"{prefix}{connector}{display_name}\n")
-        
-        children = self.get_children(node)
-        new_prefix = prefix + ("    " if is_last else "│   ")
-        
-        for i, child in enumerate(children):
-            if self.should_skip_node(child):
-                continue
-            is_last_child = (i == len(children) - 1)
-            self._build_tree(child, new_prefix, is_last_child, lines)
-            
+
     def get_indented_view(self, root: Any, indent: int = 2) -> str:
-        """生成缩进视图"""
-        lines = []
-        self._build_indent(root, 0, indent, lines)
+        """
+        生成缩进视图
+
+        与get_tree_view一样采用显式栈迭代遍历，每个节点只做一次
+        列表追加，最后统一join，避免逐节点递归调用的解释器开销。
+        """
+        lines: List[str] = []
+        append = lines.append
+        build_display_name = self.build_display_name
+
+        # 每层缩进字符串只构造一次，同层节点复用同一str对象
+        paddings: Dict[int, str] = {}
+
+        stack = [(root, 0)]
+        while stack:
+            node, level = stack.pop()
+            padding = paddings.get(level)
+            if padding is None:
+                padding = " " * (level * indent)
+                paddings[level] = padding
+            append(f"{padding}{build_display_name(node)}\n")
+            children = [child for child in self.get_children(node)
+                        if not self.should_skip_node(child)]
+            for child in reversed(children):
+                stack.append((child, level + 1))
+
         return "".join(lines)
-        
-    def _build_indent(self, node: Any, level: int, indent: int, lines: List[str]) -> None:
-        """递归构建缩进结构"""
-        current_indent = " " * (level * indent)
-        display_name = self.build_display_name(node)
-        lines.append(f"{current_indent}{display_name}\n")
-        
-        children = self.get_children(node)
-        for child in children:
-            if self.should_skip_node(child):
-                continue
-            self._build_indent(child, level + 1, indent, lines)
 
 class DirectoryPrinter(TreePrinter):
     """目录结构打印器"""
@@ -80,22 +99,37 @@ class DirectoryPrinter(TreePrinter):
         self.open_files = open_files
         self.active_file = active_file
         self.base_path: Optional[Path] = None
-        
+        self._base_prefix_len = 0  # 根路径长度（含分隔符），用于切片求相对路径
+        self._is_file_cache: Dict[str, bool] = {}  # scandir已知的文件类型，避免重复stat
+
     def get_root_name(self, root: Path) -> str:
         self.base_path = root
+        self._base_prefix_len = len(str(root)) + 1
         return root.name
         
     def get_children(self, node: Path) -> List[Path]:
         if not node.is_dir():
             return []
-        entries = sorted(list(node.iterdir()),
-                        key=lambda p: (p.is_file(), p.name))
-        return entries
+        # os.scandir的DirEntry缓存了stat结果：排序键里的目录判断
+        # 不再对每个条目额外发起一次stat系统调用
+        with os.scandir(node) as it:
+            entries = sorted(it, key=lambda e: (e.is_file(), e.name))
+        # 顺带记下文件类型，build_display_name不必再stat一次
+        children = []
+        for entry in entries:
+            self._is_file_cache[entry.path] = entry.is_file()
+            children.append(Path(entry.path))
+        return children
         
     def build_display_name(self, node: Path) -> str:
         display_name = node.name
-        if node.is_file() and self.base_path:
-            rel_path = str(node.relative_to(self.base_path))
+        is_file = self._is_file_cache.get(str(node))
+        if is_file is None:
+            is_file = node.is_file()
+        if is_file and self.base_path:
+            # 相对路径直接按根路径长度切片：比Path.relative_to逐段
+            # 比较并构造新PurePath便宜得多
+            rel_path = str(node)[self._base_prefix_len:]
             if rel_path == self.active_file:
                 display_name = f"> {display_name}"
             if rel_path in self.open_files: